@@ -1,7 +1,16 @@
 import sys
-import imp
 import json
 import os
+import stat
+import importlib.util
+
+try:
+    # orjson decodes the many small pym.json files noticeably faster; json is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+_SEP = os.sep
 
 
 class PymLoadException(ImportError):
@@ -16,45 +25,118 @@ class PymLoader(object):
         if not config:
             try:
                 with open(os.path.join(self.location, 'pym.json')) as data:
-                    config = json.load(data)
+                    config = json_loads(data.read())
             except FileNotFoundError:
                 config = {}
 
         self.config = config
         self.dependency_dir = config.get('install_location', 'pym_packages')
+        self.packages_path = os.path.join(self.location, self.dependency_dir)
 
         self.loaded = {}
+        self._config_cache = {}
+        self._path_cache = {}
+        self._index = self.load_index()
+        self._installed = self.scan_installed()
 
     def find_module(self, fullname, path=None):
-        package_path = self.calculate_path(fullname)
+        package_path, st = self.resolution(fullname)
 
-        if package_path and os.path.exists(package_path):
+        if package_path and st:
             return self
         else:
             return None
 
     def calculate_path(self, fullname):
+        return self.resolution(fullname)[0]
+
+    def resolution(self, fullname):
+        """
+        Resolve fullname once per import transaction, caching both the path and
+        its stat result so find_module, load_module, and create_module share a
+        single filesystem probe
+        """
+        if fullname in self._path_cache:
+            return self._path_cache[fullname]
+
+        package_path = self.resolve_path(fullname)
+        st = self.stat(package_path) if package_path else None
+        resolved = (package_path, st)
+        self._path_cache[fullname] = resolved
+        return resolved
+
+    def resolve_path(self, fullname):
         segments = fullname.split('.')
 
         if not len(segments):
             return None
 
         package_name = segments.pop(0)
-        partial_path = os.path.join(self.location, self.dependency_dir, package_name)
-
-        if not os.path.exists(partial_path):
+        if package_name not in self._installed:
             return None
 
-        suffix = os.path.sep.join(segments)
+        # Known-clean path pieces, so plain concatenation beats os.path.join here
+        partial_path = f"{self.packages_path}{_SEP}{package_name}"
 
-        with open(os.path.join(partial_path, 'pym.json')) as data:
-            package_config = json.load(data)
+        suffix = _SEP.join(segments)
 
-        package_src = package_config['src']
+        indexed = self._index.get(package_name)
+        if indexed is not None:
+            package_src = indexed['src']
+        else:
+            package_config = self.package_config(partial_path)
+            package_src = package_config['src']
 
-        package_path = os.path.join(partial_path, package_src, suffix)
+        package_path = f"{partial_path}{_SEP}{package_src}{_SEP}{suffix}" if suffix \
+            else f"{partial_path}{_SEP}{package_src}"
         return package_path
 
+    def scan_installed(self):
+        """
+        Read the dependency directory once so package existence becomes a set
+        lookup instead of a stat per consulted import
+        """
+        try:
+            with os.scandir(self.packages_path) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
+    def refresh(self):
+        """
+        Re-scan after packages have been installed or removed
+        """
+        self._installed = self.scan_installed()
+        self._index = self.load_index()
+        self._path_cache.clear()
+
+    def load_index(self):
+        """
+        Load the merged .pym-index.json that the installer writes, mapping
+        package name to its config. One read covers every installed package;
+        packages missing from the index fall back to their own pym.json.
+        """
+        index_path = os.path.join(self.packages_path, '.pym-index.json')
+        try:
+            with open(index_path) as data:
+                return json_loads(data.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def package_config(self, partial_path):
+        config_path = f"{partial_path}{_SEP}pym.json"
+        st = os.stat(config_path)
+        cached = self._config_cache.get(partial_path)
+
+        if cached and cached[0] == (st.st_mtime, st.st_size):
+            return cached[1]
+
+        with open(config_path) as data:
+            package_config = json_loads(data.read())
+
+        self._config_cache[partial_path] = ((st.st_mtime, st.st_size), package_config)
+        return package_config
+
     def load_module(self, fullname):
         try:
             return sys.modules[fullname]
@@ -64,22 +146,37 @@ class PymLoader(object):
         if fullname in self.loaded:
             return self.loaded[fullname]
 
-        package_path = self.calculate_path(fullname)
+        package_path, st = self.resolution(fullname)
 
-        package = self.create_module(fullname, package_path)
+        package = self.create_module(fullname, package_path, st)
 
         self.loaded[fullname] = package
         return package
 
-    def create_module(self, name, path):
-        if os.path.isdir(path):
+    def create_module(self, name, path, st=None):
+        if st is None:
+            st = self.stat(path)
+        if st and stat.S_ISDIR(st.st_mode):
             path = os.path.join(path, '__init__.py')
+            st = self.stat(path)
         else:
             path += '.py'
+            st = self.stat(path)
 
-        if not os.path.isfile(path):
+        if not st or not stat.S_ISREG(st.st_mode):
             raise PymLoadException('Failed to load module {}, maybe you are missing an __init__.py?'.format(name))
 
-        m = imp.load_source(name, path)
+        spec = importlib.util.spec_from_file_location(name, path)
+        m = importlib.util.module_from_spec(spec)
+        # Register before exec so circular imports see the partially-initialized module
+        sys.modules[name] = m
+        spec.loader.exec_module(m)
 
         return m
+
+    @staticmethod
+    def stat(path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
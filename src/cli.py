@@ -1,7 +1,10 @@
 import os
 import sys
+import atexit
 from collections import namedtuple
 
+_NL = os.linesep
+
 
 class PymCli(object):
     """
@@ -11,6 +14,8 @@ class PymCli(object):
         self.out = sys.stdout
         self.err = sys.stderr
         self.enable_debug = debug
+        self._prefixes = {}
+        atexit.register(self.flush)
 
     def info(self, message):
         self.write('info', message)
@@ -25,6 +30,8 @@ class PymCli(object):
         self.write('warning', message)
 
     def error(self, message):
+        # Keep any buffered output ordered ahead of the error message
+        self.flush()
         self.write('error', message, self.err)
 
     def debug(self, message):
@@ -33,20 +40,44 @@ class PymCli(object):
 
     def write(self, level, message, stream=None):
         stream = stream or self.out
-        stream.write("[{level}] {message}{newline}".format(level=level, message=str(message), newline=os.linesep))
+        stream.write(f"{self.prefix(level)}{message}{_NL}")
+
+    def prefix(self, level):
+        """
+        The per-level prefix never changes, so format it once and reuse it
+        :param level: {string} The log level
+        :return: {string} The formatted prefix for the level
+        """
+        try:
+            return self._prefixes[level]
+        except KeyError:
+            return self._prefixes.setdefault(level, self.make_prefix(level))
+
+    def make_prefix(self, level):
+        return f"[{level}] "
 
     def ask(self, question):
+        self.flush()
         return input(question)
 
+    def flush(self):
+        for stream in (self.out, self.err):
+            try:
+                stream.flush()
+            except ValueError:
+                pass
+
     def spacing(self, level):
         return " " * (8 - len(level))
 
 
-if os.name == 'nt':
-    from . import winapi
-
-    class Win32Cli(PymCli):
-        COLOR_MAP = {
+class Win32Cli(PymCli):
+    def __init__(self, debug=False):
+        super(Win32Cli, self).__init__(debug)
+        # Deferred so that importing this module never pays the winapi cost
+        from . import winapi
+        self.winapi = winapi
+        self.color_map = {
             'info': winapi.FOREGROUND_CYAN,
             'success': winapi.FOREGROUND_GREEN,
             'action': winapi.FOREGROUND_MAGENTA,
@@ -54,22 +85,20 @@ if os.name == 'nt':
             'error': winapi.FOREGROUND_RED,
             'debug': winapi.FOREGROUND_BLUE
         }
+        self.foreground = winapi.FOREGROUND_GREY
+        self.background = winapi.BACKGROUND_BLACK
 
-        FOREGROUND = winapi.FOREGROUND_GREY
-        BACKGROUND = winapi.BACKGROUND_BLACK
-        NEWLINE = os.linesep
-
-        def write(self, level, message, stream=None):
-            stream = stream or self.out
-            self.write_level(level, stream)
-            stream.write(str(message) + Win32Cli.NEWLINE)
+    def write(self, level, message, stream=None):
+        stream = stream or self.out
+        self.write_level(level, stream)
+        stream.write(f"{message}{_NL}")
 
-        def write_level(self, level, stream):
-            color = Win32Cli.COLOR_MAP[level]
-            winapi.set_text_attr(color | Win32Cli.BACKGROUND | winapi.FOREGROUND_INTENSITY)
-            stream.write("[{level}] {spacing}".format(level=level, spacing=self.spacing(level)))
-            stream.flush()
-            winapi.set_text_attr(Win32Cli.FOREGROUND | Win32Cli.BACKGROUND)
+    def write_level(self, level, stream):
+        color = self.color_map[level]
+        self.winapi.set_text_attr(color | self.background | self.winapi.FOREGROUND_INTENSITY)
+        stream.write(f"[{level}] {self.spacing(level)}")
+        stream.flush()
+        self.winapi.set_text_attr(self.foreground | self.background)
 
 
 def make(debug=False):
@@ -100,12 +129,6 @@ class Vt100Cli(PymCli):
 
     END_SEQ = '\033[0m'
 
-    def write(self, level, message, stream=None):
-        stream = stream or self.out
+    def make_prefix(self, level):
         color = Vt100Cli.COLORS[Vt100Cli.LEVEL_COLORS[level]]
-        end = Vt100Cli.END_SEQ
-        spacing = self.spacing(level)
-        stream.write("{color}[{level}]{end}{spacing}{message}{newline}"
-                     .format(level=level, message=str(message), newline=os.linesep, color=color, end=end,
-                             spacing=spacing))
-        stream.flush()
+        return f"{color}[{level}]{Vt100Cli.END_SEQ}{self.spacing(level)}"
@@ -1,26 +1,18 @@
-import os
-import shutil
-import errno
-import stat
 import sys
-import inspect
-import itertools
-
-from . import exceptions
-from . import package
+import importlib
 
 
 class CommandRegistry(object):
-    def __init__(self):
-        from .install import InstallCommand, UninstallCommand
-
-        self.commands = {
-            InitCommand.COMMAND: InitCommand,
-            InstallCommand.COMMAND: InstallCommand,
-            UninstallCommand.COMMAND: UninstallCommand
-        }
+    # Module, class name, and help text per subcommand; classes are imported on
+    # demand so dispatching one command never pays for the others' imports
+    COMMANDS = {
+        'init': ('.commands', 'InitCommand', 'Initialize a pym project in the current directory'),
+        'install': ('.install', 'InstallCommand', 'Install the specified package(s)'),
+        'uninstall': ('.install', 'UninstallCommand', 'Uninstall the specified package(s)')
+    }
 
-    def make(self, command, args, cli, location):
+    @classmethod
+    def make(cls, command, args, cli, location):
         """
         Create command object specified by the command argument
         :param command: {string} The command object to create
@@ -29,19 +21,52 @@ class CommandRegistry(object):
         :param location: {string} The current execution location
         :return: {PymCommand} An instance of a pym command
         """
-        cls = self.commands[command]
-        return cls.make(args, cli, location)
+        command_cls = cls.resolve(command)
+        return command_cls.make(args, cli, location)
 
-    def args(self, parser):
+    @classmethod
+    def resolve(cls, command):
+        """
+        Import and return the class registered for the given subcommand
+        :param command: {string} The subcommand name
+        :return: {type} The PymCommand subclass for the subcommand
+        """
+        module_name, cls_name, _ = cls.COMMANDS[command]
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, cls_name)
+
+    @classmethod
+    def args(cls, parser, argv=None):
         """
         Attaches args to the given parser
+        Only the subcommand actually present on the command line gets its full
+        parser built; the rest are registered as placeholders so they still show
+        in the top-level help.
         :param parser: {argparse.ArgumentParser} An argparse ArgumentParser instance
+        :param argv: {list} The command line tokens, defaulting to sys.argv[1:]
         :return: None
         """
         subparsers = parser.add_subparsers(help='pym sub-commands', dest='command')
+        selected = cls.sniff(argv)
+
+        for name, (_, _, help_text) in cls.COMMANDS.items():
+            if name == selected:
+                cls.resolve(name).args(subparsers)
+            else:
+                subparsers.add_parser(name, help=help_text)
 
-        for _, cls in self.commands.items():
-            cls.args(subparsers)
+    @staticmethod
+    def sniff(argv=None):
+        """
+        Find the subcommand named on the command line, if any
+        :param argv: {list} The command line tokens, defaulting to sys.argv[1:]
+        :return: {string} The subcommand name, or None
+        """
+        argv = sys.argv[1:] if argv is None else argv
+        for token in argv:
+            if not token.startswith('-'):
+                return token if token in CommandRegistry.COMMANDS else None
+        return None
 
 
 class PymCommand(object):
@@ -49,6 +74,7 @@ class PymCommand(object):
     Base class for create pym command objects
     Property "Command" is used for registering commands
     """
+    __slots__ = ('cli',)
     COMMAND = None
 
     @classmethod
@@ -64,7 +90,7 @@ class PymCommand(object):
             https://docs.python.org/3.6/library/argparse.html#argparse.ArgumentParser
         :return: None
         """
-        raise NotImplemented("Method 'args' not implemented in base class")
+        raise NotImplementedError("Method 'args' not implemented in base class")
 
     @classmethod
     def make(cls, cli, args, location):
@@ -75,7 +101,7 @@ class PymCommand(object):
         :param location: {string} Current execution/project location
         :return: {PymCommand} Returns an instance of the invoked PymCommand class
         """
-        raise NotImplemented("Method 'make' not implemented in base class")
+        raise NotImplementedError("Method 'make' not implemented in base class")
 
     def __init__(self, cli):
         """
@@ -90,19 +116,23 @@ class PymCommand(object):
         :param args: {dict} Command line arguments, as parsed by argparse, converted to a dict
         :return: None
         """
-        raise NotImplemented("Method 'run' not implemented in base class")
+        raise NotImplementedError("Method 'run' not implemented in base class")
 
     def cleanup(self):
         pass
 
 
 class PymCommandContext(object):
+    __slots__ = ('cli', 'cmd_name', 'args', 'location', 'cmd')
+
+    # Keyed by exception class name so the exceptions module stays off the
+    # happy-path import graph; only consulted when a command fails
     ACTIONS = {
-        exceptions.PymPackageException: "Run 'pym init' to create a project here",
-        exceptions.InstallerNotFoundException: "Double-check the installation source and version"
-                                               "(use '#' for git instead of '@')",
-        exceptions.VersionNotFoundException: "Please check that the version specified exists",
-        exceptions.PackageUrlException: "Please make sure the package and version exist"
+        'PymPackageException': "Run 'pym init' to create a project here",
+        'InstallerNotFoundException': "Double-check the installation source and version"
+                                      "(use '#' for git instead of '@')",
+        'VersionNotFoundException': "Please check that the version specified exists",
+        'PackageUrlException': "Please make sure the package and version exist"
     }
 
     def __init__(self, cli, cmd_name, args, location):
@@ -112,19 +142,19 @@ class PymCommandContext(object):
         self.location = location
 
     def __enter__(self):
-        registry = CommandRegistry()
-        self.cmd = registry.make(self.cmd_name, self.cli, self.args, self.location)
+        self.cmd = CommandRegistry.make(self.cmd_name, self.cli, self.args, self.location)
         return self.cmd
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_val and exc_type in PymCommandContext.ACTIONS:
+        if exc_val and exc_type.__name__ in PymCommandContext.ACTIONS:
             self.cli.error(str(exc_val))
-            self.cli.action(PymCommandContext.ACTIONS[exc_type])
+            self.cli.action(PymCommandContext.ACTIONS[exc_type.__name__])
             sys.exit(2)
         self.cmd.cleanup()
 
 
 class InitCommand(PymCommand):
+    __slots__ = ('info',)
     COMMAND = 'init'
 
     @classmethod
@@ -134,6 +164,8 @@ class InitCommand(PymCommand):
 
     @classmethod
     def make(cls, cli, args, location):
+        from . import package
+
         info = package.PackageInfo.parse(location)
         info.path = location
         info.src = package.PackageInfo.guess_src(info)
@@ -151,6 +183,8 @@ class InitCommand(PymCommand):
         self.cli.success('Initialized project')
 
     def create(self, info):
+        from . import package
+
         builder = package.PymConfigBuilder(self.cli)
         config = builder.query(info)
         project = package.PymPackage(info.path, config)
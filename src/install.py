@@ -12,21 +12,23 @@ The install module has the logic for installing the packages
 
 import os
 import re
-import copy
 import json
 import stat
 import errno
 import shutil
+import threading
 import requests
 import functools
-import itertools
 import collections
-import wheel.install
-from git import Repo, exc
-from bs4 import BeautifulSoup
+import concurrent.futures
+import zipfile
+
+try:
+    # orjson parses wheel metadata a few times faster; json is the fallback
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-### DEBUG
-import psutil
 
 from . import pypi
 from . import semver
@@ -42,7 +44,9 @@ class InstallCommand(PymCommand):
     3. Determine dependencies of current packages
     4. Resolve dependencies by downloading more packages, etc
     """
+    __slots__ = ('installers', 'scheme_map', 'project', 'packages_key', '_save_lock', '_reapers')
     COMMAND = 'install'
+    MAX_WORKERS = 8
 
     @classmethod
     def args(cls, subparsers):
@@ -63,13 +67,18 @@ class InstallCommand(PymCommand):
     def __init__(self, cli, installers, project):
         super(InstallCommand, self).__init__(cli)
         self.installers = installers
+        self.scheme_map = {scheme: installer for installer in installers for scheme in installer.SCHEMES}
         self.project = project
         self.packages_key = 'dependencies'
+        self._save_lock = threading.Lock()
+        self._reapers = []
 
     def cleanup(self):
         staging_dir = self.project['staging_location']
         dest = os.path.join(self.project.location, staging_dir)
         rmdir(dest)
+        for reaper in self._reapers:
+            reaper.join()
 
     def run(self, args):
         install_list = args['packages']
@@ -78,7 +87,8 @@ class InstallCommand(PymCommand):
         install_dir = self.project['install_location']
 
         if install_list:
-            references = set(install_list)
+            # dict.fromkeys dedupes while keeping the user-specified order
+            references = dict.fromkeys(install_list)
             installables = [self.find_ref_installer(reference) for reference in references]
         else:
             references = self.project[self.packages_key].items()
@@ -92,28 +102,12 @@ class InstallCommand(PymCommand):
             if e.errno != errno.EEXIST:
                 raise
 
-        packages = []
-
-        for installer, info in installables:
-            packages.append(self.install(installer, info, dest))
-
-        dep_graph = DependencyGraph()
-        for package in packages:
-            for dependency, version_range in package.config['dependencies'].items():
-                dep_graph.add(dependency, version_range)
-
-        resolutions = dep_graph.resolve()
-        for name, version_range in resolutions.items():
-            max_version = version_range.max
-            installer, info = self.find_installer(name, str(version_range))
-            info.update({
-                'version': max_version,
-                'version_range': version_range
-            })
-            packages.append(self.install(installer, info, dest, save))
+        packages = self.install_all(installables, dest)
+        packages.extend(self.install_dependencies(packages, dest, save))
 
+        install_root = os.path.join(self.project.location, install_dir)
         for pkg in packages:
-            dest = os.path.join(self.project.location, install_dir, pkg['name'])
+            dest = os.path.join(install_root, pkg['name'])
             self.unstage(pkg, dest)
             success_message = 'Successfully installed {}'.format(pkg['name'])
             if pkg['version']:
@@ -121,10 +115,127 @@ class InstallCommand(PymCommand):
             success_message += '!'
             self.cli.success(success_message)
 
+        self.precompile(install_dir, packages)
+        self.write_index(install_dir)
+
         if save:
             self.cli.info('Saving to {}'.format(self.project['name']))
             self.project.save()
 
+    def install_dependencies(self, packages, dest, save=False):
+        """
+        Install the transitive dependencies of the given packages
+        Dependencies are processed breadth-first: each newly installed batch
+        has its own dependencies fed back into the graph, and a visited set
+        ensures every package is resolved and installed at most once, so total
+        work is linear in the size of the dependency graph
+        :param packages: {list} The root PymPackage objects already installed
+        :param dest: {string} The staging destination directory
+        :param save: {bool} Whether to save each dependency to the project config
+        :return: {list} The installed dependency PymPackage objects
+        """
+        dep_graph = DependencyGraph()
+        installed = {package['name']: package.config.get('version', '') for package in packages}
+        transitives = []
+        pending = collections.deque(packages)
+
+        while pending:
+            while pending:
+                package = pending.popleft()
+                for dependency, version_range in package.config['dependencies'].items():
+                    dep_graph.add(dependency, version_range)
+
+            resolved = []
+            for name, version_range in dep_graph.resolve().items():
+                if version_range is None:
+                    raise PymPackageException('Conflicting version ranges for {}: {}'.format(
+                        name, ', '.join(sorted(dep_graph.dependencies[name]))))
+                if name in installed:
+                    # A constraint can surface after its package was already
+                    # installed; don't drop it silently — warn when the chosen
+                    # version no longer satisfies every known range
+                    try:
+                        if installed[name] not in version_range:
+                            self.cli.warn('{} {} is already installed but a later dependency requires {}'
+                                          .format(name, installed[name], version_range))
+                    except semver.VersionParseException:
+                        # Non-semantic versions (git refs) can't be checked
+                        pass
+                    continue
+                installer, info = self.find_installer(name, str(version_range))
+                info.update({
+                    'version': version_range.max,
+                    'version_range': version_range
+                })
+                installed[name] = info['version']
+                resolved.append((installer, info))
+
+            batch = self.install_all(resolved, dest, save)
+            transitives.extend(batch)
+            pending.extend(batch)
+
+        return transitives
+
+    def precompile(self, install_dir, packages):
+        """
+        Compile installed packages to bytecode once, at install time, so every
+        later import loads the cached .pyc instead of re-compiling the source
+        :param install_dir: {string} The install directory, relative to the project
+        :param packages: {list} The PymPackage objects that were just installed
+        :return: None
+        """
+        import compileall
+
+        for pkg in packages:
+            path = os.path.join(self.project.location, install_dir, pkg['name'])
+            self.cli.debug('Precompiling {}'.format(path))
+            compileall.compile_dir(path, quiet=1, workers=0)
+
+    def write_index(self, install_dir):
+        """
+        Merge every installed package's pym.json into one index file so the
+        import loader can resolve all packages with a single read
+        :param install_dir: {string} The install directory, relative to the project
+        :return: None
+        """
+        root = os.path.join(self.project.location, install_dir)
+        index = {}
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
+                    try:
+                        pkg = PymPackage.load(entry.path)
+                    except PymPackageException:
+                        continue
+                    index[entry.name] = {
+                        'src': pkg.config.get('src', 'src'),
+                        'version': pkg.config.get('version', '')
+                    }
+        except FileNotFoundError:
+            return
+
+        with open(os.path.join(root, '.pym-index.json'), 'w') as f:
+            f.write(json.dumps(index, indent=4))
+
+    def install_all(self, installables, dest, save=False):
+        """
+        Install a batch of packages, overlapping the network-bound downloads across threads
+        :param installables: {list} (installer, info) pairs as returned by find_installer
+        :param dest: {string} The staging destination directory
+        :param save: {bool} Whether to save each package to the project config
+        :return: {list} The installed PymPackage objects
+        """
+        if len(installables) <= 1:
+            return [self.install(installer, info, dest, save) for installer, info in installables]
+
+        workers = min(InstallCommand.MAX_WORKERS, len(installables))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.install, installer, info, dest, save)
+                       for installer, info in installables]
+            return [future.result() for future in futures]
+
     def install(self, installer, info, dest, save=False):
         self.cli.info('Installing {}'.format(info.reference))
         info = installer.install(info, dest)
@@ -137,7 +248,9 @@ class InstallCommand(PymCommand):
             new_package.save()
 
         if save:
-            self.project[self.packages_key][new_package['name']] = info.version_range
+            # install() runs on pool threads; serialize updates to the shared config
+            with self._save_lock:
+                self.project[self.packages_key][new_package['name']] = info.version_range
 
         return new_package
 
@@ -151,29 +264,51 @@ class InstallCommand(PymCommand):
         """
         src = pkg.location
         self.cli.debug('Moving {src} to {dest}'.format(src=src, dest=dest))
+        # Swap the old install aside rather than deleting it up front; the
+        # rename is instant and the old tree is removed off the critical path
+        old = None
+        if os.path.exists(dest):
+            old = dest + '.old'
+            try:
+                rmdir(old)
+            except FileNotFoundError:
+                pass
+            os.rename(dest, old)
         try:
-            shutil.rmtree(dest)
-        except FileNotFoundError:
-            pass
-        shutil.move(src, dest)
+            os.replace(src, dest)
+        except OSError as e:
+            # Staging and install dirs on different filesystems; fall back to copy+delete
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dest)
+        if old:
+            reaper = threading.Thread(target=rmdir, args=(old,))
+            reaper.start()
+            self._reapers.append(reaper)
 
     def find_installer(self, name, version):
-        try:
-            for i in self.installers:
-                info = i.can_install(name, version)
-                if info is not None:
-                    return i(self.cli), info
-        except StopIteration as e:
-            raise InstallerNotFoundException('Failed to find an installer for {}'.format(reference)) from e
+        for i in self.installers:
+            info = i.can_install(name, version)
+            if info is not None:
+                return i(self.cli), info
+        raise InstallerNotFoundException('Failed to find an installer for {}'.format(name))
 
     def find_ref_installer(self, reference):
-        try:
-            for i in self.installers:
-                info = i.can_install_reference(reference)
+        # References with an explicit scheme (git+..., pypi+...) dispatch in one
+        # dict probe instead of asking every installer in turn
+        scheme, sep, _ = reference.partition('+')
+        if sep:
+            installer = self.scheme_map.get(scheme)
+            if installer is not None:
+                info = installer.can_install_reference(reference)
                 if info is not None:
-                    return i(self.cli), info
-        except StopIteration as e:
-            raise InstallerNotFoundException('Failed to find an installer for {}'.format(reference)) from e
+                    return installer(self.cli), info
+
+        for i in self.installers:
+            info = i.can_install_reference(reference)
+            if info is not None:
+                return i(self.cli), info
+        raise InstallerNotFoundException('Failed to find an installer for {}'.format(reference))
 
     def create_package(self, info):
         builder = PymConfigBuilder(self.cli)
@@ -189,6 +324,11 @@ class InstallCommand(PymCommand):
 
 
 class PymInstaller(object):
+    __slots__ = ('cli',)
+
+    # Scheme prefixes (the part before '+') this installer claims outright
+    SCHEMES = ()
+
     @classmethod
     def can_install(cls, name, version):
         """
@@ -197,11 +337,11 @@ class PymInstaller(object):
         :param reference: {string} The package install reference. This may be a git location, a version range, etc
         :return: {bool} True if this installer can install the give name/reference, False otherwise
         """
-        raise NotImplemented("Function 'can_install' is not implemented in the base class")
+        raise NotImplementedError("Function 'can_install' is not implemented in the base class")
 
     @classmethod
     def can_install_reference(cls, reference):
-        raise NotImplemented("Function 'can_install_reference' is not implemented in the base class")
+        raise NotImplementedError("Function 'can_install_reference' is not implemented in the base class")
 
     def install(self, info, dest):
         """
@@ -211,13 +351,17 @@ class PymInstaller(object):
         :param name:
         :return:
         """
-        raise NotImplemented("Function 'install' is not implemented in the base class")
+        raise NotImplementedError("Function 'install' is not implemented in the base class")
 
     def __init__(self, cli):
         self.cli = cli
 
 
 class GitInstaller(PymInstaller):
+    __slots__ = ()
+    SCHEMES = ('git',)
+    SHA = re.compile(r'^[0-9a-f]{7,40}$')
+
     @classmethod
     def can_install(cls, name, version):
         info  = cls.can_install_reference(version)
@@ -229,14 +373,19 @@ class GitInstaller(PymInstaller):
     def can_install_reference(cls, reference):
         source, _, _ = reference.partition('#')
         if source.endswith('.git') or source.startswith('git+'):
-            reference = re.sub(r"^git\+", "", reference)
+            if reference.startswith('git+'):
+                reference = reference[len('git+'):]
             info = PackageInfo.parse(reference, delim='#')
             info.version_range = 'git+' + info.reference
             return info
         return None
 
     def install(self, info, dest):
-        repo = self.clone(info.source, os.path.join(dest, info.name), info.version)
+        # Keep the object store beside the working tree, not inside it, so the
+        # installed tree only ever holds a .git pointer file
+        target = os.path.join(dest, info.name)
+        git_dir = target + '.git'
+        repo = self.clone(info.source, target, info.version, git_dir)
         try:
             version = str(repo.active_branch)
         except TypeError:
@@ -249,27 +398,127 @@ class GitInstaller(PymInstaller):
             'description': repo.description,
             'version': version
         })
-        self.remove_git(info.path)
+        self.remove_git(info.path, git_dir)
         return info
 
-    def remove_git(self, path):
-        git_dir = os.path.join(path, '.git')
-        rmdir(git_dir)
+    def remove_git(self, path, git_dir=None):
+        gitfile = os.path.join(path, '.git')
+        if git_dir and os.path.isfile(gitfile):
+            # Separate-git-dir layout: drop the pointer file and the external store
+            os.unlink(gitfile)
+        else:
+            git_dir = gitfile
+
+        if os.name == 'nt':
+            # git marks object files read-only; clear the bits in one pass up front
+            # rather than paying a PermissionError retry per file during removal
+            make_writable(git_dir)
+            rmdir(git_dir)
+        else:
+            # One fork and a C-level unlink loop beats walking thousands of
+            # small git objects from Python
+            import subprocess
+            subprocess.run(['rm', '-rf', git_dir], check=True)
 
-    def clone(self, source, dest, version):
-        repo = Repo.clone_from(source, dest)
-        if version:
-            self.cli.debug("Checking out {version}...".format(version=version))
-            try:
-                git = repo.git
-                git.checkout(version)
-            except exc.GitCommandError as e:
-                raise VersionNotFoundException('Failed to find version {version}'.format(version=version)) from e
+    def check_ref(self, source, version):
+        """
+        Verify that the remote knows the requested tag or branch
+        :param source: {string} The git clone source
+        :param version: {string} The tag or branch name
+        :return: None
+        :raises VersionNotFoundException: When the remote does not list the ref
+        """
+        from git import Git, exc
+
+        try:
+            listed = Git().ls_remote('--tags', '--heads', source, version)
+        except exc.GitCommandError:
+            # Could not ask the remote; let the clone surface the real error
+            return
+        if not listed.strip():
+            raise VersionNotFoundException('Failed to find version {version}'.format(version=version))
+
+    def clone(self, source, dest, version, git_dir=None):
+        # GitPython is heavy (gitdb, smmap, git binary discovery); only pay for it
+        # once a clone is actually happening
+        from git import Repo, exc
+
+        options = ['--separate-git-dir={}'.format(git_dir)] if git_dir else []
+
+        if not version:
+            return Repo.clone_from(source, dest, depth=1, single_branch=True, multi_options=options)
+
+        self.cli.debug("Checking out {version}...".format(version=version))
+        if not GitInstaller.SHA.match(version):
+            # One cheap round trip catches a typo'd tag/branch before any clone work
+            self.check_ref(source, version)
+        try:
+            # Tags and branches can be fetched by name, so only that ref's history is transferred
+            return Repo.clone_from(source, dest, depth=1, single_branch=True, branch=version,
+                                   multi_options=options)
+        except exc.GitCommandError:
+            # A raw commit sha cannot be cloned shallowly by name; fall back to a
+            # blobless partial clone, which fetches file contents on checkout only
+            if os.path.exists(dest):
+                rmdir(dest)
+            if git_dir and os.path.exists(git_dir):
+                rmdir(git_dir)
+
+        repo = Repo.clone_from(source, dest, multi_options=['--filter=blob:none'] + options)
+        try:
+            repo.git.checkout(version)
+        except exc.GitCommandError as e:
+            raise VersionNotFoundException('Failed to find version {version}'.format(version=version)) from e
         return repo
 
 
 class PypiInstaller(PymInstaller):
-    URL = "https://pypi.python.org/pypi"
+    __slots__ = ()
+    SCHEMES = ('pypi',)
+    URL = "https://pypi.org/pypi"
+    TIMEOUT = 10
+    PROBE_BATCH = 8
+    # 'name (constraints)' as emitted in wheel metadata run_requires
+    REQUIREMENT = re.compile(r"^([A-Za-z0-9_.\-]+)\s*(?:\(([^)]*)\))?\s*$")
+    _session = None
+    _pool = None
+    # First use happens on install_all worker threads; the lock keeps two
+    # threads from each constructing (and one leaking) a pool or session
+    _lock = threading.Lock()
+
+    @classmethod
+    def pool(cls):
+        """
+        A shared process pool for wheel extraction
+        Created on first use so installs without wheels never fork workers
+        :return: {concurrent.futures.ProcessPoolExecutor} The shared pool
+        """
+        if cls._pool is None:
+            with cls._lock:
+                if cls._pool is None:
+                    cls._pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        return cls._pool
+
+    @classmethod
+    def http(cls):
+        """
+        A shared Session keeps connections alive across the many version
+        probes, skipping a TCP+TLS handshake per request
+        :return: {requests.Session} The pooled session
+        """
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    from requests.adapters import HTTPAdapter, Retry
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                          max_retries=Retry(total=3, backoff_factor=0.2))
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    session.headers['User-Agent'] = 'pym'
+                    cls._session = session
+        return cls._session
 
     @classmethod
     def can_install(cls, name, version):
@@ -280,7 +529,8 @@ class PypiInstaller(PymInstaller):
 
     @classmethod
     def can_install_reference(cls, reference):
-        reference = re.sub(r"^pypi\+", "", reference)
+        if reference.startswith('pypi+'):
+            reference = reference[len('pypi+'):]
         info = PackageInfo.parse(reference, delim='@')
         return info
 
@@ -289,24 +539,13 @@ class PypiInstaller(PymInstaller):
             info.version = self.find_max_version(info.name, info.version_range)
 
         url = self.find_download_url(info.name, info.version)
-        wheel_path = pypi.download_file(url, dest)
-        w = wheel.install.WheelFile(wheel_path)
-
-        package_name = w.parsed_filename.group('name')
-        version = w.parsed_filename.group('ver')
-        dest = os.path.join(dest, package_name.lower())
-
-        wheel_overrides = {'purelib': dest, 'platlib': dest}
-        w.install(force=True, overrides=wheel_overrides)
+        wheel_path = pypi.download_file(url, dest, session=self.http())
 
-        metadata_path = os.path.join(dest, w.distinfo_name, 'metadata.json')
+        # Extraction is CPU-bound (zlib inflate), so it goes to the shared
+        # process pool; concurrent installs overlap their unpacking there
+        version, dest, wheel_info = self.pool().submit(_extract_wheel, wheel_path, dest).result()
+        info.update({'dependencies': self.parse_requires(wheel_info.get('run_requires'))})
 
-        with open(metadata_path) as f:
-            wheel_info = json.load(f)
-            pkg_deps = self.parse_requires(wheel_info.get('run_requires'))
-            info.update({'dependencies': pkg_deps})
-
-        w.zipfile.close()
         os.remove(wheel_path)
 
         info.update({
@@ -318,32 +557,87 @@ class PypiInstaller(PymInstaller):
 
     def find_max_version(self, package_name, version_range):
         """
+        Walk each version segment upward, probing candidates in parallel
+        batches so N network round trips collapse toward one
+        :param package_name: {string} The pypi package name
+        :param version_range: {semver.VersionRange} The acceptable version range
+        :return: {semver.Version} The highest published version in range
         """
         previous = version_range.lower.version
-        segments = ['major', 'minor', 'patch']
-        seg_idx = 0
-        current = copy.copy(previous)
-        while seg_idx < len(segments):
-            current.inc(segments[seg_idx])
-            page = self.find_existing_page(package_name, current)
-            if current not in version_range or page is None:
-                current = copy.copy(previous)
-                seg_idx += 1
-            else:
-                previous = copy.copy(current)
+        for segment in ['major', 'minor', 'patch']:
+            while True:
+                candidates = self.candidates(previous, segment, version_range)
+                if not candidates:
+                    break
+
+                pages = self.probe_all(package_name, candidates)
+                best = None
+                for candidate in candidates:
+                    if pages[str(candidate)] is None:
+                        break
+                    best = candidate
+
+                if best is None:
+                    break
+                previous = best
+                if str(best) != str(candidates[-1]):
+                    # The run of published versions ended inside this batch
+                    break
         return previous
 
+    # Segment bumps as plain tuple arithmetic; probing advances version
+    # numbers with integer locals instead of copying Version objects
+    BUMPS = {
+        'major': lambda major, minor, patch: (major + 1, 0, 0),
+        'minor': lambda major, minor, patch: (major, minor + 1, 0),
+        'patch': lambda major, minor, patch: (major, minor, patch + 1)
+    }
+
+    def candidates(self, version, segment, version_range):
+        """
+        The next batch of in-range candidates above version along one segment
+        """
+        bump = PypiInstaller.BUMPS[segment]
+        triple = (version.major, version.minor, version.patch)
+        candidates = []
+        for _ in range(PypiInstaller.PROBE_BATCH):
+            triple = bump(*triple)
+            current = semver.Version(*triple)
+            if current not in version_range:
+                break
+            candidates.append(current)
+        return candidates
+
+    def probe_all(self, package_name, candidates):
+        """
+        Probe every candidate version concurrently over the pooled session
+        :return: {dict} Version string to page (or None) per candidate
+        """
+        if len(candidates) == 1:
+            return {str(candidates[0]): self.find_existing_page(package_name, candidates[0])}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            futures = {str(candidate): executor.submit(self.find_existing_page, package_name, candidate)
+                       for candidate in candidates}
+            return {version: future.result() for version, future in futures.items()}
+
     def find_existing_page(self, package_name, version):
-        url = "{}/{}/{}".format(self.URL, package_name, version)
-        page = requests.get(url)
+        if version:
+            url = "{}/{}/{}/json".format(self.URL, package_name, version)
+        else:
+            # A bare install ('pym install name') carries no version; PyPI
+            # serves the latest release at the versionless endpoint
+            url = "{}/{}/json".format(self.URL, package_name)
+        page = self.http().get(url, timeout=PypiInstaller.TIMEOUT)
         # Because pypi does not strictly enforce semver on packages, we end up with some packages that just leave of version segments
-        while page.status_code != 200 and url.endswith('.0'):
-            url = url.rstrip('.0')
-            page = requests.get(url)
+        while page.status_code != 200 and str(version).endswith('.0'):
+            version = str(version).rstrip('.0')
+            url = "{}/{}/{}/json".format(self.URL, package_name, version)
+            page = self.http().get(url, timeout=PypiInstaller.TIMEOUT)
         if page.status_code != 200:
-            page = None
+            return None
 
-        return page
+        return page.json()
 
 
     def find_download_url(self, package_name, version=""):
@@ -353,13 +647,12 @@ class PypiInstaller(PymInstaller):
         :param version:
         :return:
         """
-        page = self.find_existing_page(package_name, version)
-        if page is None:
+        data = self.find_existing_page(package_name, version)
+        if data is None:
             raise PackageUrlException('Failed to fetch page for {}@{}'.format(package_name, version))
-        soup = BeautifulSoup(page.content, 'html.parser')
-        for link in soup.select('body a'):
-            if link.string and link.string.endswith('.whl'):
-                return link['href']
+        for entry in data.get('urls', []):
+            if entry.get('packagetype') == 'bdist_wheel':
+                return entry['url']
         raise PackageUrlException('Failed to find package for {}@{}'.format(package_name, version))
 
     def parse_requires(self, wheel_requires):
@@ -402,17 +695,21 @@ class PypiInstaller(PymInstaller):
             if elem.get('extra') is None and elem.get('environment') is None:
                 requires = elem['requires']
                 for requirement in requires:
-                    package, _, version_range = requirement.partition(' ')
+                    match = PypiInstaller.REQUIREMENT.match(requirement)
+                    if match:
+                        package, version_range = match.group(1), match.group(2)
+                    else:
+                        package, _, version_range = requirement.partition(' ')
+                        version_range = version_range.strip('()')
                     if not version_range:
                         version_range = '*'
                     else:
-                        version_range = version_range.strip('()')
                         start, _, end = version_range.partition(',')
                         try:
                             if end:
-                                upper, lower = sorted([semver.Comparator.parse(start), semver.Comparator.parse(end)])
+                                upper, lower = sorted([_parse_comparator(start), _parse_comparator(end)])
                             else:
-                                lower, upper = semver.Comparator.parse(start), None
+                                lower, upper = _parse_comparator(start), None
 
                             version_range = semver.VersionRange(lower, upper)
                         except semver.VersionParseException as e:
@@ -424,6 +721,7 @@ class PypiInstaller(PymInstaller):
 
 
 class UninstallCommand(PymCommand):
+    __slots__ = ('project',)
     COMMAND = 'uninstall'
 
     @classmethod
@@ -446,19 +744,22 @@ class UninstallCommand(PymCommand):
         removables = args['packages']
         save = args['save']
         install_dir = self.project['install_location']
+        install_root = os.path.join(self.project.location, install_dir)
+        # Read straight from the config: a pym.json without a dependencies
+        # key has no fallback in DEFAULT_VALUES
+        dependencies = self.project.config.get('dependencies', {})
 
         for removable in removables:
-            location = os.path.join(self.project.location, install_dir, removable)
+            location = os.path.join(install_root, removable)
             self.cli.debug('Removing {} at {}'.format(removable, location))
-            try:
-                shutil.rmtree(location)
-                if save:
-                    del self.project['dependencies'][removable]
-                self.cli.success('Uninstalled {removable}'.format(removable=removable))
-            except FileNotFoundError as e:
+            if not os.path.exists(location):
                 self.cli.warn('Failed to uninstall {}. Are you sure the name is spelled correctly?'.format(removable))
-            except KeyError as e:
+                continue
+            rmdir(location)
+            if save and dependencies.pop(removable, None) is None:
                 self.cli.debug('{} was never saved as a dependency, but has been removed'.format(removable))
+                continue
+            self.cli.success('Uninstalled {removable}'.format(removable=removable))
         self.project.save()
 
 
@@ -466,31 +767,103 @@ class DependencyGraph(object):
     """
 
     """
+    __slots__ = ('dependencies',)
+
     def __init__(self):
         """
         """
-        self.dependencies = collections.defaultdict(list)
+        # Raw range strings, deduplicated; repeated edges (the same package
+        # required with the same range under many parents) cost nothing extra
+        self.dependencies = collections.defaultdict(dict)
 
     def add(self, name, version_range):
         """
         """
-        self.dependencies[name].append(semver.VersionRange.parse(version_range))
+        self.dependencies[name][version_range] = None
 
     def resolve(self):
         resolutions = {}
 
         for name, ranges in self.dependencies.items():
-            accepted_range = functools.reduce(lambda a, r: a.intersection(r), ranges)
-            resolutions[name] = accepted_range
+            resolutions[name] = _intersect_ranges(tuple(sorted(ranges)))
         return resolutions
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_comparator(text):
+    """
+    Parse a single comparator string, caching the result
+    The same bounds (e.g. '>=1.0') recur across many packages' requirements
+    :param text: {string} A comparator such as '>=1.0.2'
+    :return: {semver.Comparator} The parsed comparator
+    """
+    return semver.Comparator.parse(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _intersect_ranges(ranges):
+    """
+    Parse and intersect a tuple of version-range strings
+    Cached so identical constraint sets, common across resolution passes,
+    are only intersected once
+    :param ranges: {tuple} Sorted version-range strings
+    :return: {semver.VersionRange} The intersection of all given ranges
+    """
+    return semver.VersionRange.intersect_all([semver.VersionRange.parse(r) for r in ranges])
+
+
+def _extract_wheel(wheel_path, dest):
+    """
+    Extract a downloaded wheel and read its metadata
+    Module-level so it can run in a worker process
+    :param wheel_path: {string} Path to the downloaded .whl file
+    :param dest: {string} The staging directory to extract into
+    :return: {tuple} (version, package path, metadata dict)
+    """
+    # Wheel filenames are {name}-{version}-{python}-{abi}-{platform}.whl
+    package_name, version = os.path.basename(wheel_path)[:-len('.whl')].split('-')[:2]
+    dest = os.path.join(dest, package_name.lower())
+
+    with zipfile.ZipFile(wheel_path) as archive:
+        archive.extractall(dest)
+        metadata_name = '{}-{}.dist-info/metadata.json'.format(package_name, version)
+        with archive.open(metadata_name) as f:
+            wheel_info = json_loads(f.read())
+
+    return version, dest, wheel_info
+
+
+def make_writable(dirpath):
+    """
+    Mark every file under dirpath writable
+    :param dirpath: {string} The directory to walk
+    :return: None
+    """
+    for root, dirs, files in os.walk(dirpath):
+        for name in files:
+            os.chmod(os.path.join(root, name), stat.S_IWRITE | stat.S_IREAD)
+
+
 def rmdir(dirpath):
-    def handle_readonly(func, path, exc):
-        excvalue = exc[1]
-        if excvalue.errno == errno.EACCES:
+    """
+    Remove a directory tree
+    os.walk reuses the file types scandir already fetched, so this avoids the
+    per-entry stat and onerror dispatch shutil.rmtree pays. Read-only entries
+    (git object files on Windows) are chmod'ed and retried.
+    :param dirpath: {string} The directory to remove
+    :return: None
+    """
+    def remove(func, path):
+        try:
+            func(path)
+        except PermissionError:
             os.chmod(path, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)  # 0777
             func(path)
-        else:
-            raise exc[1]
-    shutil.rmtree(dirpath, ignore_errors=False, onerror=handle_readonly)
+
+    for root, dirs, files in os.walk(dirpath, topdown=False):
+        for name in files:
+            remove(os.unlink, os.path.join(root, name))
+        for name in dirs:
+            path = os.path.join(root, name)
+            remove(os.unlink if os.path.islink(path) else os.rmdir, path)
+    remove(os.rmdir, dirpath)
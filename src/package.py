@@ -2,6 +2,18 @@ import os
 import re
 import json
 
+try:
+    # orjson handles the many small pym.json files noticeably faster; json is the fallback
+    from orjson import loads as json_loads, dumps as _orjson_dumps, OPT_INDENT_2
+
+    def json_dumps(obj):
+        return _orjson_dumps(obj, option=OPT_INDENT_2).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj, indent=4)
+
 from .exceptions import PymPackageException
 
 
@@ -34,8 +46,10 @@ class PymConfigBuilder(object):
         self.cli = cli
 
     def build(self, values):
-        config = {key: values.get(key) or val for key, val in DEFAULT_CONFIG.items()}
-        return config
+        # One dict merge; the truthy filter keeps defaults winning over empty
+        # values and the key filter keeps extra info fields out of the config
+        return {**DEFAULT_CONFIG, **{key: val for key, val in values.items()
+                                     if val and key in DEFAULT_CONFIG}}
 
     def query(self, suggestions):
         values = {}
@@ -49,16 +63,29 @@ class PymConfigBuilder(object):
 
 
 class PackageInfo(dict):
-    def __getattr__(self, item):
-        return self[item]
+    # Attribute access routes into the dict itself, so instances never need
+    # their own __dict__
+    __slots__ = ()
+    _parse_cache = {}
+    _src_cache = {}
 
-    def __setattr__(self, key, value):
-        self[key] = value
+    # Bind attribute access straight to the C-level dict methods; no Python
+    # frame per lookup
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
 
     @classmethod
     def parse(cls, reference, delim='@'):
-        source, _, version = reference.partition(delim)
-        name = os.path.splitext(os.path.basename(source))[0]
+        # Instances are mutable, so cache the parsed pieces and hand each
+        # caller a fresh PackageInfo built from them
+        key = (reference, delim)
+        cached = cls._parse_cache.get(key)
+        if cached is None:
+            source, _, version = reference.partition(delim)
+            name = os.path.splitext(os.path.basename(source))[0]
+            cached = cls._parse_cache[key] = (name, version, source)
+
+        name, version, source = cached
         return PackageInfo(
             reference=reference,
             name=name,
@@ -70,15 +97,29 @@ class PackageInfo(dict):
     @staticmethod
     def guess_src(info, suffixes=None):
         suffixes = suffixes or ['src', info.name]
+        key = (info.path, tuple(suffixes))
+        if key in PackageInfo._src_cache:
+            return PackageInfo._src_cache[key]
+
+        guess = None
+        try:
+            with os.scandir(info.path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+
         for suffix in suffixes:
-            guess = os.path.join(info.path, suffix)
-            if os.path.exists(guess):
-                return os.path.relpath(guess, info.path)
+            if suffix in names:
+                guess = suffix
+                break
 
-        return None
+        PackageInfo._src_cache[key] = guess
+        return guess
 
 
 class PymPackage(object):
+    _cache = {}
+
     def __init__(self, location, config, defaults=None):
         self.location = location
         self.config = config
@@ -91,6 +132,9 @@ class PymPackage(object):
     def __setitem__(self, key, value):
         self.config[key] = value
 
+    def __delitem__(self, key):
+        del self.config[key]
+
     def __repr__(self):
         return str({
             "location": self.location,
@@ -99,19 +143,30 @@ class PymPackage(object):
         })
 
     def save(self):
-        with open(PymPackage.config_path(self.location), "w") as f:
-            f.write(json.dumps(self.config, indent=4))
+        path = PymPackage.config_path(self.location)
+        with open(path, "w") as f:
+            f.write(json_dumps(self.config))
+        PymPackage._cache[path] = (os.stat(path).st_mtime_ns, self)
 
     @classmethod
     def load(cls, location):
         path = PymPackage.config_path(location)
         try:
-            with open(path) as data:
-                config = json.load(data)
-                return PymPackage(location, config, DEFAULT_VALUES)
+            mtime = os.stat(path).st_mtime_ns
         except FileNotFoundError as e:
             raise PymPackageException('Failed to find load config file {}'.format(path)) from e
 
+        cached = cls._cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(path) as data:
+            config = json_loads(data.read())
+            package = PymPackage(location, config, DEFAULT_VALUES)
+
+        cls._cache[path] = (mtime, package)
+        return package
+
     @staticmethod
     def config_path(location):
         return os.path.join(location, 'pym.json')
@@ -1,10 +1,26 @@
 import os
 import sys
-import json
 import argparse
-from . import commands
-from . import package
-from . import cli
+import functools
+
+from . import __version__
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(registry, selected):
+    """
+    Build the argument parser once per registry and selected subcommand
+    Repeated in-process invocations (tests, REPL) skip the argparse setup
+    :param registry: {type} The CommandRegistry class
+    :param selected: {string} The subcommand named on the command line
+    :return: {argparse.ArgumentParser} The configured parser
+    """
+    parser = argparse.ArgumentParser(prog='pym', description='Manage Python packages.')
+    parser.add_argument('-d', '--debug', help='Run with debug output enabled', action='store_true')
+    parser.add_argument('-V', '--version', action='version', version='pym {}'.format(__version__))
+
+    registry.args(parser)
+    return parser
 
 
 class PymApp(object):
@@ -13,8 +29,16 @@ class PymApp(object):
         self.cli = None
 
     def run(self):
-        registry = commands.CommandRegistry()
-        args = self.args(registry)
+        # Answer --version before importing any subpackage, so it costs only
+        # interpreter startup
+        if '--version' in sys.argv[1:] or '-V' in sys.argv[1:]:
+            print('pym {}'.format(__version__))
+            sys.exit(0)
+
+        from . import commands
+        from . import cli
+
+        args = self.args(commands.CommandRegistry)
 
         self.cli = cli.make(args['debug'])
         location = os.path.realpath(os.path.join(os.getcwd()))
@@ -23,10 +47,7 @@ class PymApp(object):
             cmd.run(args)
 
     def args(self, registry):
-        parser = argparse.ArgumentParser(prog='pym', description='Manage Python packages.')
-        parser.add_argument('-d', '--debug', help='Run with debug output enabled', action='store_true')
-
-        registry.args(parser)
+        parser = _build_parser(registry, registry.sniff())
         args = vars(parser.parse_args())
 
         if not args['command']:
@@ -1,18 +1,19 @@
 
+import shutil
 import requests
 
 from os import path
 
 from . import exceptions
 
-def download_file(url, dest):
+def download_file(url, dest, session=None):
     local_filename, _, _ = url.split('/')[-1].partition('#')
     dest = path.join(dest, local_filename)
     # NOTE the stream=True parameter
-    r = requests.get(url, stream=True)
+    r = (session or requests).get(url, stream=True, timeout=30)
     with open(dest, 'wb') as f:
-        for chunk in r.iter_content(chunk_size=1024): 
-            if chunk: # filter out keep-alive new chunks
-                f.write(chunk)
-                #f.flush() commented by recommendation from J.F.Sebastian
+        # Copy straight from the raw socket in 1 MiB chunks; keeps memory flat
+        # at one chunk regardless of wheel size
+        r.raw.decode_content = True
+        shutil.copyfileobj(r.raw, f, length=1 << 20)
     return dest
@@ -19,10 +19,7 @@ Key philosophies:
 4. A spec consists of an arbitrary number of version ranges (npm semver "Version Range")
 """
 
-import re
-import copy
 from functools import total_ordering
-from collections import OrderedDict
 
 
 """
@@ -108,7 +105,9 @@ def lte(v1, v2):
 
 
 def sort(v_list, reverse=False):
-    return sorted(map(Version.parse, v_list), reverse=reverse)
+    # Sorting on the precomputed key tuples keeps the comparisons in C
+    # instead of dispatching through Version.__lt__
+    return sorted(map(Version.parse, v_list), key=lambda ver: ver._key, reverse=reverse)
 
 
 """
@@ -130,110 +129,177 @@ def contains(r, v):
 
 def range_max(r, v):
     vrange = VersionRange.parse(r)
-    versions = sort(v, reverse=True)
-    for version in versions:
-        if version in vrange:
-            return version
-    return None
+    best = None
+    best_key = None
+    seen = set()
+    for version in map(Version.parse, v):
+        # Duplicate inputs are common in index listings; test each distinct
+        # version against the range only once. Comparing the raw key tuples
+        # keeps the scan free of per-candidate dunder dispatch
+        key = version._key
+        if key in seen:
+            continue
+        seen.add(key)
+        if version in vrange and (best is None or key > best_key):
+            best = version
+            best_key = key
+    return best
 
 
 def range_min(r, v):
     vrange = VersionRange.parse(r)
-    versions = sort(v)
-    for version in versions:
-        if version in vrange:
-            return version
-    return None
+    best = None
+    best_key = None
+    seen = set()
+    for version in map(Version.parse, v):
+        key = version._key
+        if key in seen:
+            continue
+        seen.add(key)
+        if version in vrange and (best is None or key < best_key):
+            best = version
+            best_key = key
+    return best
+
+
+# Interval sentinels for open-ended ranges; tuple comparison orders them
+# below and above every version key
+_NEG_INF = (-1,)
+_POS_INF = (float('inf'),)
+
+# Segments that mark an x-range; checked with one C-level set test during
+# range dispatch
+_WILDCARDS = frozenset(('*', 'x', 'X'))
+
+
+def _overlaps(a, b):
+    """
+    Whether two (low, low inclusive, high, high inclusive) intervals overlap
+    """
+    a_low, a_low_inc, a_high, a_high_inc = a
+    b_low, b_low_inc, b_high, b_high_inc = b
+    if a_low > b_high or (a_low == b_high and not (a_low_inc and b_high_inc)):
+        return False
+    if b_low > a_high or (b_low == a_high and not (b_low_inc and a_high_inc)):
+        return False
+    return True
 
 
-@total_ordering
 class Version(object):
+    __slots__ = ('major', 'minor', 'patch', 'build', 'partial', '_key', '_str')
     PRIMARY_SEGMENTS = ['major', 'minor', 'patch']
+    _parse_cache = {}
 
     def __init__(self, major=None, minor=None, patch=None, build=""):
-        self.segments = OrderedDict({
-            'major': major or 0,
-            'minor': minor or 0,
-            'patch': patch or 0,
-            'build': build
-        })
+        self.major = major or 0
+        self.minor = minor or 0
+        self.patch = patch or 0
+        self.build = build
         self.partial = minor is None or patch is None
+        self._rekey()
+
+    def _rekey(self):
+        # Tuples compare in a C loop, so the key makes every comparison a
+        # single operation; rebuilt whenever a segment changes
+        self._key = (self.major, self.minor, self.patch, self.build)
+        self._str = None
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        return isinstance(other, Version) and self._key == other._key
 
     def __lt__(self, other):
-        for seg in self.segments:
-            if self[seg] < other[seg]:
-                return True
-            elif self[seg] > other[seg]:
-                return False
-        return False
+        return self._key < other._key
+
+    def __le__(self, other):
+        return self._key <= other._key
+
+    def __gt__(self, other):
+        return self._key > other._key
+
+    def __ge__(self, other):
+        return self._key >= other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
     def __copy__(self):
         return Version(self.major, self.minor, self.patch, self.build)
 
     def __getitem__(self, item):
-        return self.segments[item]
+        return getattr(self, item)
 
     def __setitem__(self, key, value):
-        self.segments[key] = value
+        setattr(self, key, value)
+        self._rekey()
 
     def __str__(self):
-        out = "{}.{}.{}".format(self.major, self.minor, self.patch)
-        if self.build:
-            out += "-" + self.build
+        out = self._str
+        if out is None:
+            out = f'{self.major}.{self.minor}.{self.patch}'
+            if self.build:
+                out += f'-{self.build}'
+            self._str = out
         return out
 
     def __repr__(self):
-        return "Version(major={major}, minor={minor}, patch={patch}, build={build})".format(**self.segments)
-
-    @property
-    def major(self):
-        return self['major']
-
-    @property
-    def minor(self):
-        return self['minor']
-
-    @property
-    def patch(self):
-        return self['patch']
-
-    @property
-    def build(self):
-        return self['build']
+        return f'Version(major={self.major}, minor={self.minor}, patch={self.patch}, build={self.build})'
 
     @property
     def prerelease(self):
         return self.build.split('.')
 
     def inc(self, release, identifier=None):
-        try:
-            idx = Version.PRIMARY_SEGMENTS.index(release)
-            remainder = Version.PRIMARY_SEGMENTS[idx+1:]
-            for seg in remainder:
-                self.segments[seg] = 0
-            self.segments[release] += 1
-        except ValueError as e:
-            pass
+        if release == 'major':
+            self.major += 1
+            self.minor = 0
+            self.patch = 0
+        elif release == 'minor':
+            self.minor += 1
+            self.patch = 0
+        elif release == 'patch':
+            self.patch += 1
+        else:
+            return
+        self._rekey()
 
     @classmethod
     def parse(cls, version_str):
-        try:
-            version_str = cls.clean(version_str)
-            primary, _, build = version_str.partition('-')
-            parts = iter(primary.split('.'))
-            vmajor = int(next(parts))
-            vminor = int(next(parts, 0)) or None
-            vpatch = int(next(parts, 0)) or None
-            return cls(vmajor, vminor, vpatch, build)
-        except ValueError as e:
-            raise VersionParseException('Invalid version string {}'.format(version_str)) from e
+        # Instances are mutable, so cache the parsed segments and build each
+        # caller a fresh Version from them
+        cached = cls._parse_cache.get(version_str)
+        if cached is None:
+            try:
+                if version_str and version_str[0].isdigit() and '-' not in version_str:
+                    # Already-clean input skips the strip and build split
+                    primary, build = version_str, ""
+                else:
+                    cleaned = cls.clean(version_str)
+                    primary, _, build = cleaned.partition('-')
+                parts = primary.split('.')
+                vmajor = int(parts[0])
+                # Absent segments stay None so partial is tracked; an explicit
+                # zero (as in 1.0.0) is a full version, not a partial one
+                vminor = int(parts[1]) if len(parts) > 1 else None
+                vpatch = int(parts[2]) if len(parts) > 2 else None
+            except ValueError as e:
+                raise VersionParseException('Invalid version string {}'.format(version_str)) from e
+            cached = cls._parse_cache[version_str] = (vmajor, vminor, vpatch, build)
+        return cls(*cached)
 
     @staticmethod
     def clean(version_str):
-        return version_str.strip().lstrip('=v')
+        # Find the kept span once and slice once; already-clean input is
+        # returned as-is with no allocation at all
+        i, j = 0, len(version_str)
+        while i < j and version_str[i].isspace():
+            i += 1
+        while j > i and version_str[j - 1].isspace():
+            j -= 1
+        while i < j and version_str[i] in '=v':
+            i += 1
+        if i == 0 and j == len(version_str):
+            return version_str
+        return version_str[i:j]
 
 
 @total_ordering
@@ -241,9 +307,35 @@ class Comparator(object):
     """
     Version Comparator: >3.0.1, <=2.1.17, etc.
     """
+    # satisfies is a slot because __init__ binds the comparison method there
+    __slots__ = ('operator', 'version', 'direction', 'satisfies')
+    _parse_cache = {}
+
+    # The operation map seems backwards for less than/greater than comparisons
+    # because we are comparing as the right side of the equation, not the left
+    OPERATIONS = {
+        '<': '__gt__',
+        '<=': '__ge__',
+        '>': '__lt__',
+        '>=': '__le__',
+        '=': '__eq__'
+    }
+
+    DIRECTIONS = {
+        '<': -2,
+        '<=': -1,
+        '=': 0,
+        '>': 1,
+        '>=': 2
+    }
+
     def __init__(self, operator, version):
         self.operator = operator
         self.version = version
+        self.direction = Comparator.DIRECTIONS[operator]
+        # Bind the comparison once; satisfies is then a direct method call
+        # with no per-call dict building
+        self.satisfies = getattr(version, Comparator.OPERATIONS[operator])
 
     def __str__(self):
         return self.operator + str(self.version)
@@ -260,9 +352,6 @@ class Comparator(object):
         else:
             return other.direction > self.direction
 
-    def satisfies(self, version):
-        return self.operation(version)
-
     def intersects(self, other):
         return self.intersection(other) is not None
 
@@ -280,58 +369,46 @@ class Comparator(object):
             smaller, larger = sorted([self, other], reverse=True)
             intersection = VersionRange(smaller, larger)
 
-        print('Intersection of {} and {} is {}'.format(self, other, intersection))
-
         return intersection
 
-    @property
-    def operation(self):
-        """
-        The operation map seems backwards for less than/greater than comparisons because we are comparing
-        as the right side of the equation, not the left.
-        :return: {func} The appropriate comparison operation
-        """
-        call_map = {
-            '<': self.version.__gt__,
-            '<=': self.version.__ge__,
-            '>': self.version.__lt__,
-            '>=': self.version.__le__,
-            '=': self.version.__eq__
-        }
-        return call_map[self.operator]
-
-    @property
-    def direction(self):
-        direction_map = {
-            '<': -2,
-            '<=': -1,
-            '=': 0,
-            '>': 1,
-            '>=': 2
-        }
-        return direction_map[self.operator]
-
     @classmethod
     def parse(cls, v):
-        m = re.search(r'(<=|<|>=|>)', v)
-        if m is not None:
-            op = m.group(0)
-            version = v.lstrip(op)
-        else:
-            op = '='
-            version = v
+        # Comparators hold a mutable Version, so cache the split pieces and
+        # build each caller a fresh instance
+        cached = cls._parse_cache.get(v)
+        if cached is None:
+            # Only four operator prefixes exist; a slice test beats the regex
+            # engine, and the exact-length slice avoids lstrip eating leading
+            # characters out of the version itself
+            if v.startswith(('<=', '>=')):
+                op, version = v[:2], v[2:]
+            elif v.startswith(('<', '>')):
+                op, version = v[:1], v[1:]
+            else:
+                op, version = '=', v
+            cached = cls._parse_cache[v] = (op, version)
+        op, version = cached
         return Comparator(op, Version.parse(version))
 
 
 class VersionRange(object):
+    __slots__ = ('lower', 'upper', '_low', '_low_inc', '_high', '_high_inc')
+    _parse_cache = {}
+
     def __init__(self, lower, upper=None):
         self.lower = lower
         self.upper = upper
+        # The interval form is fixed once the comparators are known;
+        # membership and sweep tests reuse it without re-deriving
+        self._low, self._low_inc, self._high, self._high_inc = self._bounds()
 
     def __contains__(self, item):
         if isinstance(item, str):
             item = Version.parse(item)
-        return self.lower.satisfies(item) and (self.upper is None or self.upper.satisfies(item))
+        key = item._key
+        if key < self._low or (key == self._low and not self._low_inc):
+            return False
+        return key < self._high or (key == self._high and self._high_inc)
 
     def __str__(self):
         vrange = str(self.lower)
@@ -351,6 +428,35 @@ class VersionRange(object):
             max_version = self.upper.version
         return max_version
 
+    def bounds(self):
+        """
+        The range in interval form for sweep and membership comparisons
+        :return: {tuple} (low key, low inclusive, high key, high inclusive),
+            with open ends represented by the infinity sentinels
+        """
+        return self._low, self._low_inc, self._high, self._high_inc
+
+    def _bounds(self):
+        low, low_inclusive = _NEG_INF, True
+        high, high_inclusive = _POS_INF, True
+        for comparator in (self.lower, self.upper):
+            if comparator is None:
+                continue
+            op = comparator.operator
+            key = comparator.version._key
+            if op == '=':
+                low, low_inclusive = key, True
+                high, high_inclusive = key, True
+            elif op == '>':
+                low, low_inclusive = key, False
+            elif op == '>=':
+                low, low_inclusive = key, True
+            elif op == '<':
+                high, high_inclusive = key, False
+            elif op == '<=':
+                high, high_inclusive = key, True
+        return low, low_inclusive, high, high_inclusive
+
     def is_over(self, version):
         return self.upper is not None and not self.upper.satisfies(version) and self.lower.satisfies(version)
 
@@ -358,28 +464,10 @@ class VersionRange(object):
         return not self.lower.satisfies(version) and self.upper.satisfies(version)
 
     def intersects(self, other):
-        if self.upper is None and other.upper is None:
-            return self.lower.intersects(other.lower)
-
-        if self.upper is None:
-            return self.lower.intersects(other.upper)
-
-        if other.upper is None:
-            return other.lower.intersects(self.upper) and other.lower.intersects()
-
-        return self.upper.intersects(other.lower) and self.lower.intersects(other.upper)
-
-    def intersection(self, other):
-        if self.upper is None and other.upper is None:
-            return self.lower.intersection(other.lower)
-
-        if self.upper is None:
-            return self.lower.intersection(other.upper)
-
-        if other.upper is None:
-            return other.lower.intersects(self.upper) and other.lower.intersects()
-
-        return self.upper.intersects(other.lower) and self.lower.intersects(other.upper)
+        # The stored interval bounds already encode unbounded ends with the
+        # infinity sentinels, so a single overlap test covers every case
+        # without the per-comparator dispatch
+        return _overlaps(self.bounds(), other.bounds())
 
     @staticmethod
     def valid(v):
@@ -387,38 +475,91 @@ class VersionRange(object):
 
     @classmethod
     def intersection(cls, r1, r2):
-        if r1.upper is None and r2.upper is None:
-            return cls(r1.lower.intersection(r2.lower))
-
-        if r1.upper is None:
-            return r1.lower.intersection(r2.upper)
+        """
+        The range admitted by both r1 and r2
+        :param r1: {VersionRange}
+        :param r2: {VersionRange}
+        :return: {VersionRange} The overlapping range, or None when disjoint
+        """
+        b1 = r1.bounds()
+        b2 = r2.bounds()
+        if not _overlaps(b1, b2):
+            return None
+
+        # The tighter bound wins each side: the greater low and lesser high,
+        # with the exclusive bound taking precedence on a key tie
+        low, exclusive = max((b1[0], not b1[1]), (b2[0], not b2[1]))
+        high, high_inclusive = min((b1[2], b1[3]), (b2[2], b2[3]))
+
+        if low == high:
+            return cls(Comparator('=', Version(*low)))
+
+        lower = None if low is _NEG_INF else Comparator('>' if exclusive else '>=', Version(*low))
+        upper = None if high is _POS_INF else Comparator('<=' if high_inclusive else '<', Version(*high))
+
+        if lower is None:
+            # Every parsed range carries a lower comparator, so promote the
+            # upper one rather than build a range with a None lower
+            return cls(upper) if upper is not None else r1
+        return cls(lower, upper)
 
-        if r2.upper is None:
-            return r2.lower if r2.lower in r2 else None
+    @classmethod
+    def intersect_all(cls, ranges):
+        """
+        Intersect a sequence of ranges in one tight loop
+        :param ranges: {list} VersionRange objects, at least one
+        :return: {VersionRange} The intersection of all given ranges, or None
+            when any pair is disjoint
+        """
+        result = ranges[0]
+        for r in ranges[1:]:
+            result = cls.intersection(result, r)
+            if result is None:
+                return None
+        return result
 
     @classmethod
     def parse(cls, v):
-        lower, _, upper = v.partition(' - ')
-        if upper:
+        # Ranges are fully described by their class and bound comparators;
+        # cache those pieces and rebuild fresh instances, since the held
+        # versions are mutable
+        cached = cls._parse_cache.get(v)
+        if cached is None:
+            parsed = cls._parse(v)
+            upper = parsed.upper
+            cls._parse_cache[v] = (type(parsed), parsed.lower.operator, str(parsed.lower.version),
+                                   upper.operator if upper else None, str(upper.version) if upper else None)
+            return parsed
+
+        range_cls, lower_op, lower_version, upper_op, upper_version = cached
+        upper = Comparator(upper_op, Version.parse(upper_version)) if upper_op else None
+        return range_cls(Comparator(lower_op, Version.parse(lower_version)), upper)
+
+    @classmethod
+    def _parse(cls, v):
+        # Cheap containment/find tests classify the string without building
+        # partition tuples it mostly throws away
+        if ' - ' in v:
             return HyphenRange.parse(v)
 
-        lower, _, upper = v.partition(' ')
-        if upper:
-            return cls(Comparator.parse(lower), Comparator.parse(upper))
+        space = v.find(' ')
+        if space != -1:
+            return cls(Comparator.parse(v[:space]), Comparator.parse(v[space + 1:]))
 
-        if any(x in v.split('.') for x in ('*', 'x', 'X')):
+        if not _WILDCARDS.isdisjoint(v.split('.')):
             return XRange.parse(v)
 
-        if v.startswith('~'):
+        first = v[:1]
+        if first == '~':
             return TildeRange.parse(v)
 
-        if v.startswith('^'):
+        if first == '^':
             return CaretRange.parse(v)
 
-        cl = Comparator.parse(lower)
+        cl = Comparator.parse(v)
 
         if cl.operator == '=':
-            cu = Comparator.parse(lower)
+            cu = Comparator.parse(v)
         else:
             cu = None
 
@@ -426,6 +567,8 @@ class VersionRange(object):
 
 
 class HyphenRange(VersionRange):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, v):
         lower, _, upper = v.partition(' - ')
@@ -437,34 +580,37 @@ class HyphenRange(VersionRange):
 
 
 class XRange(VersionRange):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, v):
-        vlower = Version()
-        vupper = Version()
-        previous = None
-        segs = iter(Version.PRIMARY_SEGMENTS)
+        # Collect the fixed segments as plain ints and build each bound
+        # Version once, instead of mutating placeholder instances per piece
+        los = [0, 0, 0]
+        his = [0, 0, 0]
+        previous = -1
         for piece in v.split('.'):
-            if piece in ('*', 'x', 'X'):
-                if previous is not None:
-                    vupper[previous] += 1
-                    upper = Comparator('<', vupper)
-                else:
-                    upper = None
-                lower = Comparator('>=', vlower)
-                return cls(lower, upper)
-            else:
-                previous = next(segs)
-                vlower[previous] = int(piece)
-                vupper[previous] = int(piece)
+            if piece in _WILDCARDS:
+                lower = Comparator('>=', Version(*los))
+                if previous < 0:
+                    return cls(lower, None)
+                his[previous] += 1
+                return cls(lower, Comparator('<', Version(*his)))
+            previous += 1
+            los[previous] = his[previous] = int(piece)
         raise VersionParseException("Failed to parse '{}'".format(v))
 
 
 class TildeRange(VersionRange):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, v):
-        vlower = Version.parse(v.lstrip('~'))
+        # Dispatch guarantees the single '~' prefix; slicing it off avoids
+        # lstrip's character-set scan
+        vlower = Version.parse(v[1:])
         lower = Comparator('>=', vlower)
-        vupper = copy.copy(vlower)
+        vupper = Version(vlower.major, vlower.minor, vlower.patch, vlower.build)
         if vupper.minor or vupper.patch:
             vupper.inc('minor')
         else:
@@ -474,32 +620,50 @@ class TildeRange(VersionRange):
 
 
 class CaretRange(VersionRange):
+    __slots__ = ()
+
     @classmethod
     def parse(cls, v):
-        vlower = Version.parse(v.lstrip('^'))
+        vlower = Version.parse(v[1:])
         lower = Comparator('>=', vlower)
         vupper = Version()
-        for attr, x in vlower.segments.items():
-            if x != 0:
+        for attr in Version.PRIMARY_SEGMENTS:
+            if vlower[attr] != 0:
                 vupper[attr] = vlower[attr] + 1
                 break
         return cls(lower, Comparator('<', vupper))
 
 
 class Spec(object):
+    __slots__ = ('ranges',)
+    _parse_cache = {}
+
     def __init__(self, ranges):
         self.ranges = ranges
 
     def intersects(self, spec):
-        for r in self.ranges:
-            if any(r.intersects(s) for s in spec.ranges):
+        # Sweep both interval lists sorted by lower bound instead of testing
+        # every pair; advance whichever interval ends first
+        mine = sorted(r.bounds() for r in self.ranges)
+        theirs = sorted(r.bounds() for r in spec.ranges)
+        i = j = 0
+        while i < len(mine) and j < len(theirs):
+            if _overlaps(mine[i], theirs[j]):
                 return True
+            if mine[i][2] <= theirs[j][2]:
+                i += 1
+            else:
+                j += 1
         return False
 
     @classmethod
     def parse(cls, spec):
-        ranges = [VersionRange.parse(v) for v in spec.split(' or ')]
-        return cls(ranges)
+        # Cache the split once per spec string; the ranges themselves come
+        # fresh from VersionRange's own piece cache
+        pieces = cls._parse_cache.get(spec)
+        if pieces is None:
+            pieces = cls._parse_cache[spec] = spec.split(' or ')
+        return cls([VersionRange.parse(v) for v in pieces])
 
 
 class SemverException(Exception):
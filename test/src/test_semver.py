@@ -2,6 +2,11 @@ import unittest
 from src import semver
 
 
+# Shared read-only comparand; several suites check parses against 1.2.3 and
+# never mutate it, so one instance serves them all
+V123 = semver.Version(1, 2, 3)
+
+
 class TestSemver(unittest.TestCase):
     def test_range_max(self):
         winner = semver.range_max('1.*', ['1.0.9', '2.56.7', '1.19', '1.4.8'])
@@ -15,7 +20,7 @@ class TestSemver(unittest.TestCase):
 class TestVersion(unittest.TestCase):
     def test_parse(self):
         v = semver.Version.parse('1.2.3')
-        self.assertEqual(v, semver.Version(1, 2, 3))
+        self.assertEqual(v, V123)
 
         v = semver.Version.parse('1.2.3-abc')
         self.assertEqual(v, semver.Version(1, 2, 3, 'abc'))
@@ -24,10 +29,10 @@ class TestVersion(unittest.TestCase):
         self.assertEqual(v, semver.Version(1, 2, 3, '4.5.6'))
 
         v = semver.Version.parse('v1.2.3')
-        self.assertEqual(v, semver.Version(1, 2, 3))
+        self.assertEqual(v, V123)
 
         v = semver.Version.parse('=1.2.3')
-        self.assertEqual(v, semver.Version(1, 2, 3))
+        self.assertEqual(v, V123)
 
         v = semver.Version.parse('=1.2')
         self.assertEqual(v, semver.Version(1, 2, 0))
@@ -37,6 +42,14 @@ class TestVersion(unittest.TestCase):
         self.assertEqual(v, semver.Version(1, 0, 0))
         self.assertTrue(v.partial)
 
+        v = semver.Version.parse('1.0.3')
+        self.assertEqual(v, semver.Version(1, 0, 3))
+        self.assertFalse(v.partial)
+
+        v = semver.Version.parse('2.0.0')
+        self.assertEqual(v, semver.Version(2, 0, 0))
+        self.assertFalse(v.partial)
+
     def test_inc(self):
         v = semver.Version.parse('1.2.3')
         v.inc('minor')
@@ -72,15 +85,15 @@ class TestComparator(unittest.TestCase):
     def test_parse(self):
         c = semver.Comparator.parse('<1.2.3')
         self.assertEqual(c.operator, '<')
-        self.assertEqual(c.version, semver.Version(1, 2, 3))
+        self.assertEqual(c.version, V123)
 
         c = semver.Comparator.parse('>=1.2.3')
         self.assertEqual(c.operator, '>=')
-        self.assertEqual(c.version, semver.Version(1, 2, 3))
+        self.assertEqual(c.version, V123)
 
         c = semver.Comparator.parse('1.2.3')
         self.assertEqual(c.operator, '=')
-        self.assertEqual(c.version, semver.Version(1, 2, 3))
+        self.assertEqual(c.version, V123)
 
         c = semver.Comparator.parse('>=4.5.6')
         self.assertEqual(c.operator, '>=')
@@ -120,13 +133,13 @@ class TestComparator(unittest.TestCase):
         self.assertFalse(c2 < c1)
 
     def test_satisfies(self):
-        c = semver.Comparator('=', semver.Version(1, 2, 3))
-        self.assertTrue(c.satisfies(semver.Version(1, 2, 3)))
+        c = semver.Comparator('=', V123)
+        self.assertTrue(c.satisfies(V123))
 
-        c = semver.Comparator('<', semver.Version(1, 2, 3))
+        c = semver.Comparator('<', V123)
         self.assertTrue(c.satisfies(semver.Version(1, 1, 3)))
 
-        c = semver.Comparator('>', semver.Version(1, 2, 3))
+        c = semver.Comparator('>', V123)
         self.assertTrue(c.satisfies(semver.Version(1, 3, 3)))
 
         c = semver.Comparator.parse('>1.0.0')
@@ -187,7 +200,7 @@ class TestVersionRange(unittest.TestCase):
         r = semver.VersionRange.parse('>=1.2.3')
         self.assertIsInstance(r, semver.VersionRange)
         self.assertEqual(r.lower.operator, '>=')
-        self.assertEqual(r.lower.version, semver.Version(1, 2, 3))
+        self.assertEqual(r.lower.version, V123)
         self.assertIsNone(r.upper)
 
         r = semver.VersionRange.parse('1.2.3 - 4.5.6')
@@ -250,18 +263,28 @@ class TestVersionRange(unittest.TestCase):
         r2 = semver.VersionRange.parse('3.3.0')
         self.assertFalse(r1.intersects(r2))
 
+        r1 = semver.VersionRange.parse('>=1.0.0')
+        r2 = semver.VersionRange.parse('>=2.0.0 <3.0.0')
+        self.assertTrue(r1.intersects(r2))
+        self.assertTrue(r2.intersects(r1))
+
+        r1 = semver.VersionRange.parse('>=1.0.0')
+        r2 = semver.VersionRange.parse('<0.5.0')
+        self.assertFalse(r1.intersects(r2))
+        self.assertFalse(r2.intersects(r1))
+
 
 class TestHyphenRange(unittest.TestCase):
     def test_parse(self):
         r = semver.HyphenRange.parse('1.2.3 - 4.5.6')
         self.assertEqual(r.lower.operator, '>=')
-        self.assertEqual(r.lower.version, semver.Version(1, 2, 3))
+        self.assertEqual(r.lower.version, V123)
         self.assertEqual(r.upper.operator, '<=')
         self.assertEqual(r.upper.version, semver.Version(4, 5, 6))
 
         r = semver.HyphenRange.parse('1.2.3 - 4.5')
         self.assertEqual(r.lower.operator, '>=')
-        self.assertEqual(r.lower.version, semver.Version(1, 2, 3))
+        self.assertEqual(r.lower.version, V123)
         self.assertEqual(r.upper.operator, '<')
         self.assertEqual(r.upper.version, semver.Version(4, 5, 0))
 
@@ -290,7 +313,7 @@ class TestTildeRange(unittest.TestCase):
     def test_parse(self):
         r = semver.TildeRange.parse('~1.2.3')
         self.assertEqual(r.lower.operator, '>=')
-        self.assertEqual(r.lower.version, semver.Version(1, 2, 3))
+        self.assertEqual(r.lower.version, V123)
         self.assertEqual(r.upper.operator, '<')
         self.assertEqual(r.upper.version, semver.Version(1, 3, 0))
 
@@ -299,7 +322,7 @@ class TestCaretRange(unittest.TestCase):
     def test_parse(self):
         r = semver.CaretRange.parse('^1.2.3')
         self.assertEqual(r.lower.operator, '>=')
-        self.assertEqual(r.lower.version, semver.Version(1, 2, 3))
+        self.assertEqual(r.lower.version, V123)
         self.assertEqual(r.upper.operator, '<')
         self.assertEqual(r.upper.version, semver.Version(2, 0, 0))
 